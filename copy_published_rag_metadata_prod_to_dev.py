@@ -11,15 +11,31 @@ Safe-ish behavior:
 - Runs inside a dev transaction: TRUNCATE + insert; rolls back on failure.
 - Does not print any database URLs or secrets.
 
+Bulk-load mode (--bulk-load):
+- Records the dev table's index/constraint definitions from the catalog.
+- Drops secondary indexes that pg_get_indexdef can recreate exactly (not unique,
+  no backing constraint, valid, no tablespace/comment/statistics target/CLUSTER
+  mark), defers deferrable constraints (including constraint triggers), loads,
+  then recreates the indexes with a tuned maintenance_work_mem and parallel
+  maintenance workers, and finishes with ANALYZE.
+- With --skip-triggers, also disables the enabled ordinary user triggers by name
+  for the load and restores each to its original mode afterwards. Those triggers
+  do NOT run for the copied rows.
+- Everything stays in the same dev transaction, so a failure still rolls back
+  the TRUNCATE, the trigger changes, the dropped indexes and the partial load together.
+
 Usage (from repo root, using shared venv):
   # PROD_CHAT_DATABASE_URL must be set in the environment (do NOT commit it)
   .venv/bin/python3 mobius-config/copy_published_rag_metadata_prod_to_dev.py
+  .venv/bin/python3 mobius-config/copy_published_rag_metadata_prod_to_dev.py --bulk-load
 """
 
 from __future__ import annotations
 
+import argparse
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Iterable, List, Sequence
 
@@ -90,7 +106,132 @@ def _iter_rows(conn, table: str, cols: Sequence[str], batch_size: int = 1000) ->
     cur.close()
 
 
+def _get_indexes(conn, table: str) -> list[tuple[str, str, bool]]:
+    """
+    Return (index_name, index_def, droppable) for the table's indexes.
+
+    An index is droppable only if it is valid and ready, not unique, no
+    constraint (on this table or a referencing one) depends on it, and recreating it from
+    pg_get_indexdef restores it exactly: no explicit tablespace, no comment,
+    no per-column statistics target and not marked for CLUSTER.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT i.relname,
+                   pg_get_indexdef(ix.indexrelid),
+                   ix.indisvalid
+                   AND ix.indisready
+                   AND NOT ix.indisunique
+                   AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = ix.indexrelid)
+                   AND NOT ix.indisclustered
+                   AND i.reltablespace = 0
+                   AND obj_description(ix.indexrelid, 'pg_class') IS NULL
+                   AND NOT EXISTS (
+                       SELECT 1 FROM pg_attribute a
+                       WHERE a.attrelid = ix.indexrelid
+                         AND COALESCE(a.attstattarget, -1) >= 0
+                   )
+            FROM pg_index ix
+            JOIN pg_class i ON i.oid = ix.indexrelid
+            JOIN pg_class t ON t.oid = ix.indrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname='public'
+              AND t.relname=%s
+            ORDER BY i.relname
+            """,
+            (table,),
+        )
+        return [(r[0], r[1], bool(r[2])) for r in cur.fetchall()]
+
+
+def _get_constraints(conn, table: str) -> list[tuple[str, str, bool]]:
+    """Return (constraint_name, constraint_def, deferrable) for the table's constraints."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT c.conname, pg_get_constraintdef(c.oid), c.condeferrable
+            FROM pg_constraint c
+            JOIN pg_class t ON t.oid = c.conrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname='public'
+              AND t.relname=%s
+            ORDER BY c.conname
+            """,
+            (table,),
+        )
+        return [(r[0], r[1], bool(r[2])) for r in cur.fetchall()]
+
+
+# pg_trigger.tgenabled -> clause restoring that mode ('D' = disabled).
+_TRIGGER_ENABLE_SQL = {
+    "O": "ENABLE TRIGGER",
+    "R": "ENABLE REPLICA TRIGGER",
+    "A": "ENABLE ALWAYS TRIGGER",
+}
+
+
+def _get_triggers(conn, table: str) -> list[tuple[str, str]]:
+    """
+    Return (trigger_name, tgenabled) for the table's ordinary user triggers.
+
+    Constraint triggers are excluded: they are handled by SET CONSTRAINTS.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT tg.tgname, tg.tgenabled
+            FROM pg_trigger tg
+            JOIN pg_class t ON t.oid = tg.tgrelid
+            JOIN pg_namespace n ON n.oid = t.relnamespace
+            WHERE n.nspname='public'
+              AND t.relname=%s
+              AND NOT tg.tgisinternal
+              AND tg.tgconstraint = 0
+            ORDER BY tg.tgname
+            """,
+            (table,),
+        )
+        return [(r[0], str(r[1])) for r in cur.fetchall()]
+
+
+def _non_negative_int(value: str) -> int:
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+    return n
+
+
 def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Drop non-essential indexes during the load, rebuild them afterwards and ANALYZE.",
+    )
+    ap.add_argument(
+        "--skip-triggers",
+        action="store_true",
+        help=(
+            "With --bulk-load, disable enabled ordinary user triggers during the load and restore them "
+            "afterwards. These triggers will NOT run for the copied rows."
+        ),
+    )
+    ap.add_argument(
+        "--maintenance-work-mem",
+        default="1GB",
+        help="maintenance_work_mem for index rebuilds in --bulk-load mode (default: 1GB).",
+    )
+    ap.add_argument(
+        "--rebuild-workers",
+        type=_non_negative_int,
+        default=4,
+        help="max_parallel_maintenance_workers for index rebuilds in --bulk-load mode (default: 4).",
+    )
+    args = ap.parse_args()
+    if args.skip_triggers and not args.bulk_load:
+        ap.error("--skip-triggers requires --bulk-load")
+
     _load_dev_env()
 
     table = "published_rag_metadata"
@@ -99,6 +240,7 @@ def main() -> int:
 
     try:
         import psycopg2
+        from psycopg2 import sql
         from psycopg2.extras import execute_values
     except Exception as e:
         print(f"ERROR: psycopg2 is required in the venv: {e}")
@@ -141,12 +283,47 @@ def main() -> int:
         print(f"- source_rows={prod_n}")
         print(f"- dest_rows_before={dev_n_before}")
 
+        dropped: list[tuple[str, str]] = []
+        skipped_triggers: list[tuple[str, str]] = []
+        if args.bulk_load:
+            indexes = _get_indexes(dst, table)
+            constraints = _get_constraints(dst, table)
+            dropped = [(name, idx_def) for name, idx_def, droppable in indexes if droppable]
+            print(f"- dest_indexes={len(indexes)} dropping={len(dropped)}")
+            deferred = [(name, con_def) for name, con_def, deferrable in constraints if deferrable]
+            print(f"- dest_constraints={len(constraints)} deferring={len(deferred)}")
+            for name, con_def in deferred:
+                print(f"- deferred_constraint={name}: {con_def}")
+            if args.skip_triggers:
+                triggers = _get_triggers(dst, table)
+                skipped_triggers = [(name, mode) for name, mode in triggers if mode in _TRIGGER_ENABLE_SQL]
+                print(f"- dest_triggers={len(triggers)} skipping={len(skipped_triggers)}")
+                for name, mode in skipped_triggers:
+                    print(f"- skipped_trigger={name} (restored as {_TRIGGER_ENABLE_SQL[mode]})")
+
+            # Set before TRUNCATE so a bad value fails before any work is done;
+            # SET LOCAL lasts for the whole transaction, including the rebuild.
+            with dst.cursor() as cur:
+                cur.execute("SET LOCAL maintenance_work_mem = %s", (args.maintenance_work_mem,))
+                cur.execute("SET LOCAL max_parallel_maintenance_workers = %s", (args.rebuild_workers,))
+
         with dst.cursor() as cur:
             cur.execute(f"TRUNCATE TABLE public.{table}")
+            if args.bulk_load:
+                cur.execute("SET CONSTRAINTS ALL DEFERRED")
+                for name, _ in skipped_triggers:
+                    cur.execute(
+                        sql.SQL("ALTER TABLE {} DISABLE TRIGGER {}").format(
+                            sql.Identifier("public", table), sql.Identifier(name)
+                        )
+                    )
+                for name, _ in dropped:
+                    cur.execute(sql.SQL("DROP INDEX {}").format(sql.Identifier("public", name)))
 
         col_sql = ", ".join([f'"{c}"' for c in cols])
         insert_sql = f"INSERT INTO public.{table} ({col_sql}) VALUES %s"
 
+        load_start = time.perf_counter()
         written = 0
         for batch in _iter_rows(src, table, cols, batch_size=1000):
             with dst.cursor() as cur:
@@ -154,6 +331,31 @@ def main() -> int:
             written += len(batch)
             if written % 5000 == 0:
                 print(f"- copied_rows={written}")
+        load_secs = time.perf_counter() - load_start
+
+        if args.bulk_load:
+            with dst.cursor() as cur:
+                for name, mode in skipped_triggers:
+                    cur.execute(
+                        sql.SQL("ALTER TABLE {} " + _TRIGGER_ENABLE_SQL[mode] + " {}").format(
+                            sql.Identifier("public", table), sql.Identifier(name)
+                        )
+                    )
+
+            # Rebuild in the same transaction: other connections can't build
+            # indexes on a table we hold TRUNCATE's lock on, so parallelism comes
+            # from Postgres' parallel maintenance workers instead.
+            rebuild_start = time.perf_counter()
+            with dst.cursor() as cur:
+                for name, idx_def in dropped:
+                    cur.execute(idx_def)
+                    print(f"- rebuilt_index={name}")
+            rebuild_secs = time.perf_counter() - rebuild_start
+
+            analyze_start = time.perf_counter()
+            with dst.cursor() as cur:
+                cur.execute(f"ANALYZE public.{table}")
+            analyze_secs = time.perf_counter() - analyze_start
 
         dst.commit()
         src.commit()
@@ -161,6 +363,10 @@ def main() -> int:
         dev_n_after = _count_rows(dst, table)
         print(f"- copied_rows_total={written}")
         print(f"- dest_rows_after={dev_n_after}")
+        print(f"- load_seconds={load_secs:.1f}")
+        if args.bulk_load:
+            print(f"- rebuild_seconds={rebuild_secs:.1f}")
+            print(f"- analyze_seconds={analyze_secs:.1f}")
         return 0
     except Exception as e:
         try: